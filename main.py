@@ -9,10 +9,24 @@ import random  # For random transitions
 import socket
 import platform
 import subprocess
+import threading
+import gc  # For freeing replaced slides after a reload
+import hashlib  # For scaled slide cache keys
+from collections import OrderedDict
 from PIL import Image
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import numpy as np  # For imageio frame arrays and pygame surfarray
+try:
+    import numba  # Optional: JIT-compiles the dissolve block-copy kernel
+    # TBB can deadlock imageio's ffmpeg subprocess once a parallel region has run
+    numba.config.THREADING_LAYER = 'workqueue'
+except ImportError:
+    numba = None
+try:
+    import psutil  # Optional: lists interface addresses without spawning ifconfig/ip
+except ImportError:
+    psutil = None
 
 # Set environment variables for better Raspberry Pi compatibility
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
@@ -46,6 +60,19 @@ QR_BORDER = config.get('qr_border', 2)
 AVAILABLE_TRANSITIONS = config.get('available_transitions', ['fade', 'slide', 'dissolve', 'zoom'])
 TRANSITION_FPS = config.get('transition_fps', 15)  # Lower FPS for transitions on Pi
 USE_FAST_TRANSITIONS = config.get('use_fast_transitions', False)  # Simplified transitions for Pi
+HARDWARE_DECODE = config.get('hardware_decode', True)  # Try GPU/VPU video decoding before software
+RELOAD_DEBOUNCE = config.get('reload_debounce', 0.5)  # Seconds of quiet before reloading changed slides
+RENDER_SIZE = config.get('render_size')  # Optional [w, h] logical resolution, scaled to the panel by the GPU
+CACHE_DIR = config.get('cache_dir', '~/.cache/pygame-slideshow')  # Screen-sized slide cache, null to disable
+if CACHE_DIR:
+    CACHE_DIR = os.path.expanduser(CACHE_DIR)
+ZOOM_CACHE_BYTES = int(config.get('zoom_cache_mb', 0) * 1024 * 1024)  # Memory for reusable zoom frames, 0 to disable
+
+# ffmpeg input params for hardware decoders, tried in order before software decode
+if platform.machine().startswith(('arm', 'aarch64')):
+    HW_DECODE_PARAMS = [['-c:v', 'h264_v4l2m2m'], ['-hwaccel', 'auto']]  # Pi V4L2 m2m decoder
+else:
+    HW_DECODE_PARAMS = [['-hwaccel', 'auto']]
 
 # Setup logging to errors.txt (only errors)
 logging.basicConfig(filename=ERROR_LOG, level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -67,6 +94,11 @@ display_modes = [
     (pygame.FULLSCREEN, "basic fullscreen"),
     (0, "windowed mode")
 ]
+if RENDER_SIZE:
+    # Draw at a fixed logical size and let SDL's renderer scale it to the panel on present
+    display_modes.insert(0, (pygame.FULLSCREEN | pygame.SCALED, "GPU-scaled fullscreen"))
+    # pygame defaults SCALED to nearest-neighbour; filtering on the GPU is free and looks far better on photos
+    os.environ.setdefault('SDL_RENDER_SCALE_QUALITY', 'linear')
 
 for driver, driver_name in drivers_to_try:
     if driver:
@@ -82,6 +114,8 @@ for driver, driver_name in drivers_to_try:
             try:
                 if mode == 0:
                     screen = pygame.display.set_mode((1280, 720), mode)
+                elif mode & pygame.SCALED:
+                    screen = pygame.display.set_mode(tuple(RENDER_SIZE), mode)
                 else:
                     screen = pygame.display.set_mode((0, 0), mode)
                 print(f"Display initialized: {driver_name} with {mode_name}")
@@ -99,6 +133,11 @@ if screen is None:
     print("ERROR: Could not initialize any display mode")
     pygame.quit()
     exit(1)
+
+# The display size is fixed once set, so look it up once instead of in every frame loop
+SCREEN_W, SCREEN_H = screen.get_size()
+SCREEN_SIZE = (SCREEN_W, SCREEN_H)
+LINE_HEIGHT = FONT_SIZE + 5  # Footer line spacing
 font = pygame.font.SysFont('freesans', FONT_SIZE)
 startup_font = pygame.font.SysFont('freesans', 20)  # Smaller font for startup info
 clock = pygame.time.Clock()  # For timing control
@@ -116,7 +155,12 @@ def get_system_info():
     # Get IP addresses
     try:
         # Get all network interfaces
-        if platform.system() == "Darwin":  # macOS
+        if psutil is not None:
+            for interface, addrs in psutil.net_if_addrs().items():
+                for addr in addrs:
+                    if addr.family == socket.AF_INET and addr.address != '127.0.0.1':
+                        info.append(f"{interface}: {addr.address}")
+        elif platform.system() == "Darwin":  # macOS
             result = subprocess.run(['ifconfig'], capture_output=True, text=True)
             lines = result.stdout.split('\n')
             current_interface = None
@@ -153,35 +197,45 @@ def get_system_info():
 
     return info
 
+SLIDE_ADVANCE_EVENT = pygame.event.custom_type()  # Fired by a one-shot timer when an image slide's time is up
+
+def is_quit_event(event):
+    """Return True if the event asks to quit (window close, Escape or Cmd+Q)."""
+    if event.type == pygame.QUIT:
+        return True
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_ESCAPE:
+            return True
+        if event.key == pygame.K_q and pygame.key.get_mods() & pygame.KMOD_GUI:
+            return True
+    return False
+
 def display_startup_message():
     """Display startup message with system information for 60 seconds."""
-    system_info = get_system_info()
+    # Gather system info in the background so the startup screen shows up immediately
+    system_info = {}
+    threading.Thread(target=lambda: system_info.update(lines=get_system_info()), daemon=True).start()
 
     start_time = time.time()
     while time.time() - start_time < 60:
         # Check for quit events
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if is_quit_event(event):
                 return False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return False
-                elif event.key == pygame.K_q and pygame.key.get_mods() & pygame.KMOD_GUI:
-                    return False
-                elif event.key == pygame.K_SPACE:  # Allow space to skip startup
-                    return True
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:  # Allow space to skip startup
+                return True
 
         # Draw startup screen
         screen.fill((0, 0, 0))  # Black background
 
         # Title
         title_surf = font.render("PyGame Slideshow - Starting Up", True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(screen.get_width() // 2, 50))
+        title_rect = title_surf.get_rect(center=(SCREEN_W // 2, 50))
         screen.blit(title_surf, title_rect)
 
         # System info
         y_pos = 120
-        for line in system_info:
+        for line in system_info.get('lines', ["Gathering system information..."]):
             if line.strip():  # Skip empty lines for spacing
                 text_surf = startup_font.render(line, True, (200, 200, 200))
                 screen.blit(text_surf, (50, y_pos))
@@ -190,7 +244,7 @@ def display_startup_message():
         # Time remaining
         remaining = int(60 - (time.time() - start_time))
         time_surf = startup_font.render(f"Starting slideshow in {remaining} seconds... (Press SPACE to skip)", True, (255, 255, 0))
-        screen.blit(time_surf, (50, screen.get_height() - 50))
+        screen.blit(time_surf, (50, SCREEN_H - 50))
 
         pygame.display.flip()
         clock.tick(FPS)
@@ -201,34 +255,121 @@ def display_error(message):
     """Display error message on screen for a duration."""
     screen.fill((0, 0, 0))  # Black background
     text_surf = font.render(message, True, (255, 0, 0))  # Red text
-    text_rect = text_surf.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
+    text_rect = text_surf.get_rect(center=(SCREEN_W // 2, SCREEN_H // 2))
     screen.blit(text_surf, text_rect)
     pygame.display.flip()
     time.sleep(ERROR_RETRY_DELAY)
 
+def probe_video_decoder(video_path):
+    """Return ffmpeg input params for the first hardware decoder that can read the video."""
+    if not HARDWARE_DECODE:
+        return []
+    for input_params in HW_DECODE_PARAMS:
+        try:
+            reader = imageio.get_reader(video_path, input_params=list(input_params))
+            try:
+                reader.get_data(0)  # Decoder errors only surface once a frame is read
+            finally:
+                reader.close()
+            return input_params
+        except Exception as e:
+            logging.error(f"Hardware decode {' '.join(input_params)} failed for '{video_path}': {str(e)}")
+    return []  # Software decode
+
+def image_cache_path(image_path, signature):
+    """Return where the screen-sized copy of this version of an image is cached."""
+    key = hashlib.sha1(f"{image_path}:{signature}:{SCREEN_W}x{SCREEN_H}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, key + '.bmp')
+
+def prune_image_cache():
+    """Delete cached copies no current slide uses (edited, renamed or removed slides, other screen sizes)."""
+    if not CACHE_DIR or not os.path.isdir(CACHE_DIR):
+        return
+    keep = {os.path.basename(image_cache_path(slide_path, signature))
+            for slide_path, (signature, slide) in slide_cache.items() if slide['type'] == 'image'}
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            # Only touch files this cache wrote: a sha1 hex name with a .bmp extension
+            key = entry.name.split('.', 1)[0]
+            if (entry.name.endswith('.bmp') and len(key) == 40 and all(c in '0123456789abcdef' for c in key)
+                    and entry.name not in keep):
+                try:
+                    os.remove(entry.path)
+                except OSError as e:
+                    logging.error(f"Error removing stale cached slide '{entry.path}': {str(e)}")
+
+def load_image(image_path, signature):
+    """Return the image scaled to the screen, from the on-disk cache when it was scaled before."""
+    cache_path = None
+    if CACHE_DIR:
+        cache_path = image_cache_path(image_path, signature)
+        if os.path.exists(cache_path):
+            return pygame.image.load(cache_path)  # Uncompressed, no decode or scale needed
+
+    # Decode and resize with Pillow (drop-in pillow-simd speeds this up further)
+    pil_img = Image.open(image_path)
+    pil_img.draft('RGB', SCREEN_SIZE)  # Let JPEG decode at a reduced scale when possible
+    pil_img = pil_img.convert('RGB')
+    if pil_img.size != SCREEN_SIZE:
+        pil_img = pil_img.resize(SCREEN_SIZE, Image.BILINEAR)
+    img = pygame.image.frombuffer(pil_img.tobytes(), pil_img.size, 'RGB')
+
+    if cache_path:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = cache_path + '.tmp.bmp'
+            pygame.image.save(img, tmp_path)
+            os.replace(tmp_path, cache_path)  # Never leave a half-written cache file behind
+        except Exception as e:
+            logging.error(f"Error caching scaled slide '{image_path}': {str(e)}")
+    return img
+
 def load_content():
-    global slides, footer_lines, qr_surface
+    global slides, slide_cache, footer_lines, qr_surface, overlay_blits
     slides = []
-    screen_size = screen.get_size()
-    for file in sorted(os.listdir(SLIDE_DIR)):  # Alphabetical order
+    new_cache = {}
+    with os.scandir(SLIDE_DIR) as it:
+        entries = sorted(it, key=lambda entry: entry.name)  # Alphabetical order
+    for entry in entries:
+        file = entry.name
         try:
-            if file.lower().endswith(('.jpg', '.png')):
-                img_path = os.path.join(SLIDE_DIR, file)
-                img = pygame.image.load(img_path)
-                img = pygame.transform.scale(img, screen_size)
+            if not file.lower().endswith(('.jpg', '.png', '.mp4')) or not entry.is_file():
+                continue
+            slide_path = entry.path
+
+            # Reuse the already loaded slide if the file hasn't changed since the last load
+            stat = entry.stat()
+            signature = (stat.st_mtime, stat.st_size)
+            cached = slide_cache.get(slide_path)
+            if cached and cached[0] == signature:
+                slide = cached[1]
+            elif file.lower().endswith(('.jpg', '.png')):
+                img = load_image(slide_path, signature)
                 # Convert to screen format for faster blitting
                 img = img.convert()
-                slides.append({'type': 'image', 'surface': img})
-            elif file.lower().endswith('.mp4'):
-                video_path = os.path.join(SLIDE_DIR, file)
-                # Validate video file can be opened
-                reader = imageio.get_reader(video_path)
-                reader.close()  # Close immediately after validation
-                slides.append({'type': 'video', 'path': video_path})
+                slide = {'type': 'image', 'surface': img}
+            else:
+                # Check hardware decode support once per file instead of on every playback
+                input_params = probe_video_decoder(slide_path)
+                # Validate the video now; playback opens its own reader and closes it afterwards
+                with imageio.get_reader(slide_path, input_params=list(input_params)) as reader:
+                    video_fps = reader.get_meta_data().get('fps')
+                slide = {'type': 'video', 'path': slide_path, 'input_params': input_params, 'fps': video_fps}
+
+            new_cache[slide_path] = (signature, slide)
+            slides.append(slide)
         except Exception as e:
             logging.error(f"Error loading slide '{file}': {str(e)}")
             # Continue to next file, skip invalid
 
+    # Only keep files that are still present, so removed slides can be freed
+    slide_cache = new_cache
+    # Forget zoom frames scaled from slides that were removed or replaced
+    surfaces = {slide['surface'] for slide in slides if slide['type'] == 'image'}
+    for key in [key for key in zoom_cache if key[0] not in surfaces]:
+        del zoom_cache[key]
+    prune_image_cache()
+
     # Load footer text
     footer_lines = []
     footer_path = os.path.join(SLIDE_DIR, 'footer.txt')
@@ -248,52 +389,110 @@ def load_content():
             with open(qr_path, 'r') as f:
                 url = f.read().strip()
             if url:
+                # Generate at one pixel per module, then upscale with pygame's nearest-neighbour
+                # scale, which is exact for a QR code and much cheaper than drawing large boxes
                 qr = qrcode.QRCode(
                     version=1,
                     error_correction=qrcode.constants.ERROR_CORRECT_L,
-                    box_size=QR_BOX_SIZE,
+                    box_size=1,
                     border=QR_BORDER,
                 )
                 qr.add_data(url)
                 qr.make(fit=True)
-                img = qr.make_image(fill_color="black", back_color="white")
-                img = img.convert('RGB')
-                qr_surface = pygame.image.fromstring(img.tobytes(), img.size, img.mode)
-                # Convert QR surface for faster blitting
-                qr_surface = qr_surface.convert_alpha()
+                # Build the pixels straight from the module matrix (border included), no PIL image needed
+                modules = np.asarray(qr.get_matrix(), dtype=bool)  # (h, w), True = dark module
+                pixels = np.where(modules, 0, 255).astype(np.uint8)  # Black on white
+                rgb = np.repeat(pixels[..., None], 3, axis=2)  # Contiguous row-major RGB, wrapped without a copy
+                qr_height, qr_width = modules.shape
+                qr_surface = pygame.image.frombuffer(rgb, (qr_width, qr_height), 'RGB')
+                qr_surface = pygame.transform.scale(qr_surface, (qr_width * QR_BOX_SIZE, qr_height * QR_BOX_SIZE))
+                # Convert QR surface for faster blitting; it is opaque, so skip the per-pixel alpha path
+                qr_surface = qr_surface.convert()
         except Exception as e:
             logging.error(f"Error generating QR code: {str(e)}")
 
-def render_overlays():
-    # Render footer with blue background if lines exist
+    overlay_blits = build_overlays()
+
+def build_footer():
+    """Return the footer's blit entries, re-rendering them only when footer_lines changed."""
+    global footer_cache
+    if footer_cache is not None and footer_cache[0] == footer_lines:
+        return footer_cache[1]
+
+    footer_height = len(footer_lines) * LINE_HEIGHT
+    # Calculate width: max text width + padding
+    max_width = max(font.size(line)[0] for line in footer_lines) + 40  # 20px padding each side
+    x, y = 10, SCREEN_H - footer_height - 20  # 10px left padding, padding from bottom
+
+    # Plain RGB background; a translucent one gets per-surface alpha, far cheaper to blit than per-pixel alpha
+    bg_surf = pygame.Surface((max_width, footer_height + 10)).convert()  # +10 for inner padding
+    bg_surf.fill(FOOTER_BG_COLOR[:3])
+    alpha = FOOTER_BG_COLOR[3] if len(FOOTER_BG_COLOR) > 3 else 255
+
+    text_blits = []
+    text_y = 5  # Inner top padding
+    for line in footer_lines:
+        text_surf = font.render(line, True, TEXT_COLOR).convert_alpha()
+        text_blits.append((text_surf, (10, text_y)))  # 20px from the screen edge
+        text_y += LINE_HEIGHT
+
+    if alpha == 255:
+        # Opaque background: draw the text into it so the whole footer is a single plain blit
+        bg_surf.blits(text_blits, doreturn=False)
+        blits = [(bg_surf, (x, y))]
+    else:
+        # Draw the text over the translucent background on screen, blending it into
+        # the background surface instead would darken the antialiased edges
+        bg_surf.set_alpha(alpha)
+        blits = [(bg_surf, (x, y))] + [(surf, (x + tx, y + ty)) for surf, (tx, ty) in text_blits]
+
+    footer_cache = (list(footer_lines), blits)
+    return blits
+
+def build_overlays():
+    """Pre-render the footer and QR code into a (surface, position) list for render_overlays."""
+    blits = []
+
+    # Footer with blue background if lines exist
     if footer_lines:
-        line_height = FONT_SIZE + 5
-        footer_height = len(footer_lines) * line_height
-        # Calculate width: max text width + padding
-        max_width = max(font.size(line)[0] for line in footer_lines) + 40  # 20px padding each side
-        y = screen.get_height() - footer_height - 20  # Padding from bottom
-
-        # Create semi-transparent blue background surface
-        bg_surf = pygame.Surface((max_width, footer_height + 10), pygame.SRCALPHA)  # +10 for inner padding
-        bg_surf = bg_surf.convert_alpha()  # Convert for faster blitting
-        bg_surf.fill(FOOTER_BG_COLOR)
-
-        # Blit background
-        screen.blit(bg_surf, (10, y))  # 10px left padding
-
-        # Render text lines on top
-        text_y = y + 5  # Inner top padding
-        for line in footer_lines:
-            text_surf = font.render(line, True, TEXT_COLOR)
-            screen.blit(text_surf, (20, text_y))  # Adjusted for padding
-            text_y += line_height
-
-    # Render QR code in bottom-right if available (no background for QR)
+        blits.extend(build_footer())
+
+    # QR code in bottom-right if available (no background for QR)
     if qr_surface:
         qr_width, qr_height = qr_surface.get_size()
-        x = screen.get_width() - qr_width - 20
-        y = screen.get_height() - qr_height - 20
-        screen.blit(qr_surface, (x, y))
+        blits.append((qr_surface, (SCREEN_W - qr_width - 20, SCREEN_H - qr_height - 20)))
+
+    return blits
+
+def render_overlays():
+    # All overlays were rendered at load time, draw them in one batched call
+    screen.blits(overlay_blits, doreturn=False)
+
+if numba is not None:
+    @numba.njit(parallel=True, boundscheck=False, fastmath=True, cache=True)
+    def copy_blocks(dst, src, blocks, blocks_y, block_size):
+        """Copy the given blocks (indices into the x-major block grid) from src into dst."""
+        width, height = dst.shape[0], dst.shape[1]
+        for i in numba.prange(blocks.shape[0]):
+            x0 = (blocks[i] // blocks_y) * block_size
+            y0 = (blocks[i] % blocks_y) * block_size
+            for y in range(y0, min(y0 + block_size, height)):
+                for x in range(x0, min(x0 + block_size, width)):
+                    dst[x, y, 0] = src[x, y, 0]
+                    dst[x, y, 1] = src[x, y, 1]
+                    dst[x, y, 2] = src[x, y, 2]
+
+    # Compile now with display-format views so the first dissolve frame isn't stalled
+    _warm_surf = pygame.Surface((2, 2)).convert()
+    if _warm_surf.get_bytesize() >= 3:
+        _warm_pixels = pygame.surfarray.pixels3d(_warm_surf)
+        copy_blocks(_warm_pixels, _warm_pixels, np.zeros(1, dtype=np.int64), 1, 1)
+        del _warm_pixels
+    del _warm_surf
+
+# Transition timing is fixed at startup, so build the per-step tables once
+TRANSITION_STEPS = max(1, int(TRANSITION_DURATION * TRANSITION_FPS))
+TRANSITION_PROGRESS = [step / TRANSITION_STEPS for step in range(TRANSITION_STEPS)]
 
 # Optimized transition functions for Raspberry Pi performance
 def transition_fade(current_surf, next_surf):
@@ -313,40 +512,29 @@ def transition_fade(current_surf, next_surf):
         return
 
     # Regular fade using horizontal strips (faster than alpha)
-    transition_steps = int(TRANSITION_DURATION * TRANSITION_FPS)
-    screen_height = screen.get_height()
-    strip_height = max(1, screen_height // transition_steps)
-
-    # Start with current surface
-    work_surf = current_surf.copy()
+    for step in range(TRANSITION_STEPS):
+        # Next slide covers the top, current slide the rest; the last step reaches the bottom
+        split = SCREEN_H * (step + 1) // TRANSITION_STEPS
 
-    for step in range(transition_steps):
-        # Calculate which strips to replace this step
-        strips_to_replace = step + 1
-        strips_height = strips_to_replace * strip_height
-
-        # Replace strips from top down
-        if strips_height > 0:
-            strip_rect = pygame.Rect(0, 0, screen.get_width(), min(strips_height, screen_height))
-            work_surf.blit(next_surf, (0, 0), strip_rect)
-
-        screen.blit(work_surf, (0, 0))
+        # Blit each source straight to the screen, no full-screen work surface copy needed
+        screen.blit(next_surf, (0, 0), pygame.Rect(0, 0, SCREEN_W, split))
+        screen.blit(current_surf, (0, split), pygame.Rect(0, split, SCREEN_W, SCREEN_H - split))
         render_overlays()
         pygame.display.flip()
         clock.tick(TRANSITION_FPS)
 
 def transition_slide(current_surf, next_surf):
-    width = screen.get_width()
     if USE_FAST_TRANSITIONS:
         # Fast slide: just 4 steps
         positions = [0.25, 0.5, 0.75, 1.0]
     else:
-        transition_steps = int(TRANSITION_DURATION * TRANSITION_FPS)
-        positions = [step / transition_steps for step in range(transition_steps)]
+        positions = TRANSITION_PROGRESS
 
     for progress in positions:
-        screen.blit(current_surf, (-width * progress, 0))
-        screen.blit(next_surf, (width * (1 - progress), 0))
+        # Blit only the visible part of each slide, meeting at an integer seam
+        offset = int(SCREEN_W * progress)
+        screen.blit(current_surf, (0, 0), pygame.Rect(offset, 0, SCREEN_W - offset, SCREEN_H))
+        screen.blit(next_surf, (SCREEN_W - offset, 0), pygame.Rect(0, 0, offset, SCREEN_H))
         render_overlays()
         pygame.display.flip()
         clock.tick(TRANSITION_FPS)
@@ -354,19 +542,70 @@ def transition_slide(current_surf, next_surf):
 def transition_dissolve(current_surf, next_surf):
     # Optimized dissolve using rectangular blocks instead of individual pixels
     block_size = 8 if USE_FAST_TRANSITIONS else 4
-    width, height = screen.get_size()
-    blocks_x = width // block_size
-    blocks_y = height // block_size
-
-    # Create list of block positions
-    blocks = [(x * block_size, y * block_size) for x in range(blocks_x) for y in range(blocks_y)]
-    random.shuffle(blocks)
+    width, height = SCREEN_SIZE
 
     if USE_FAST_TRANSITIONS:
         # Fast dissolve: fewer steps
         transition_steps = 8
     else:
-        transition_steps = int(TRANSITION_DURATION * TRANSITION_FPS)
+        transition_steps = TRANSITION_STEPS
+
+    # surfarray can only view 24/32-bit surfaces, keep the blit path for other display depths
+    if current_surf.get_bytesize() < 3 or next_surf.get_bytesize() < 3:
+        transition_dissolve_blits(current_surf, next_surf, block_size, transition_steps)
+        return
+
+    # Round up so the partial blocks along the right/bottom edge dissolve too
+    blocks_x = -(-width // block_size)
+    blocks_y = -(-height // block_size)
+    num_blocks = blocks_x * blocks_y
+    order = np.random.permutation(num_blocks)
+    blocks_per_step = num_blocks // transition_steps
+
+    # work_surf starts as the current slide; each step copies in only the newly revealed blocks
+    work_surf = current_surf.copy()
+    nxt = pygame.surfarray.pixels3d(next_surf)  # Zero-copy (w, h, 3) view
+    step_blocks = np.zeros(num_blocks, dtype=bool)
+
+    for step in range(transition_steps):
+        start_idx = step * blocks_per_step
+        end_idx = start_idx + blocks_per_step if step < transition_steps - 1 else num_blocks
+        new_blocks = order[start_idx:end_idx]
+
+        out = pygame.surfarray.pixels3d(work_surf)
+        if numba is not None:
+            copy_blocks(out, nxt, new_blocks, blocks_y, block_size)
+        else:
+            # Expand this step's blocks to a pixel mask and copy them in one vectorized assignment
+            step_blocks[:] = False
+            step_blocks[new_blocks] = True
+            mask = step_blocks.reshape(blocks_x, blocks_y)
+            mask = mask.repeat(block_size, axis=0).repeat(block_size, axis=1)[:width, :height]
+            out[mask] = nxt[mask]
+        del out  # Release the surface lock before blitting
+
+        screen.blit(work_surf, (0, 0))
+        render_overlays()
+        pygame.display.flip()
+        clock.tick(TRANSITION_FPS)
+
+    del nxt
+
+def get_dissolve_rects(block_size):
+    """Return the block Rects covering the screen, building them on first use for each block size."""
+    rects = dissolve_rects.get(block_size)
+    if rects is None:
+        width, height = SCREEN_SIZE
+        # Round up so the partial blocks along the right/bottom edge dissolve too (blits clip them)
+        rects = [pygame.Rect(x * block_size, y * block_size, block_size, block_size)
+                 for x in range(-(-width // block_size)) for y in range(-(-height // block_size))]
+        dissolve_rects[block_size] = rects
+    return rects
+
+def transition_dissolve_blits(current_surf, next_surf, block_size, transition_steps):
+    # Shuffle the cached block rects; each is both the source area and the destination
+    rects = get_dissolve_rects(block_size)
+    blocks = [rects[i] for i in np.random.permutation(len(rects))]
 
     # Start with current surface
     work_surf = current_surf.copy()
@@ -376,51 +615,56 @@ def transition_dissolve(current_surf, next_surf):
         start_idx = step * blocks_per_step
         end_idx = start_idx + blocks_per_step if step < transition_steps - 1 else len(blocks)
 
-        # Copy blocks from next surface to work surface
-        for i in range(start_idx, end_idx):
-            x, y = blocks[i]
-            block_rect = pygame.Rect(x, y, block_size, block_size)
-            work_surf.blit(next_surf, (x, y), block_rect)
+        # Copy this step's blocks from next surface to work surface in one batched call
+        work_surf.blits([(next_surf, rect, rect) for rect in blocks[start_idx:end_idx]], doreturn=False)
 
         screen.blit(work_surf, (0, 0))
         render_overlays()
         pygame.display.flip()
         clock.tick(TRANSITION_FPS)
 
+def zoom_scaled(surf, size):
+    """Return surf scaled to size, reusing frames scaled by earlier zoom transitions."""
+    if size == surf.get_size():
+        return surf  # Full size, nothing to scale or cache
+
+    key = (surf, size)
+    scaled = zoom_cache.get(key)
+    if scaled is not None:
+        zoom_cache.move_to_end(key)
+        return scaled
+
+    # Use regular scale instead of smoothscale for better performance
+    scaled = pygame.transform.scale(surf, size)
+    if scaled.get_pitch() * scaled.get_height() <= ZOOM_CACHE_BYTES:
+        zoom_cache[key] = scaled
+        # Drop the least recently used frames until the cache fits its memory budget
+        while sum(cached.get_pitch() * cached.get_height() for cached in zoom_cache.values()) > ZOOM_CACHE_BYTES:
+            zoom_cache.popitem(last=False)
+    return scaled
+
 def transition_zoom(current_surf, next_surf):
-    center_x, center_y = screen.get_width() // 2, screen.get_height() // 2
+    width, height = SCREEN_SIZE
+    center = (width // 2, height // 2)
 
     if USE_FAST_TRANSITIONS:
         # Pre-compute just 4 zoom levels
         scales = [0.75, 0.5, 0.25, 0.0]
     else:
-        transition_steps = int(TRANSITION_DURATION * TRANSITION_FPS)
-        scales = [1 - (step / transition_steps) for step in range(transition_steps)]
-
-    # Pre-scale the surfaces to avoid repeated smoothscale calls
-    scaled_surfaces = []
-    for scale in scales:
-        if scale > 0:
-            current_scale = scale
-            next_scale = 1 - scale
-
-            # Use regular scale instead of smoothscale for better performance
-            scaled_current = pygame.transform.scale(current_surf,
-                (max(1, int(screen.get_width() * current_scale)),
-                 max(1, int(screen.get_height() * current_scale))))
-            scaled_next = pygame.transform.scale(next_surf,
-                (max(1, int(screen.get_width() * next_scale)),
-                 max(1, int(screen.get_height() * next_scale))))
-
-            scaled_surfaces.append((scaled_current, scaled_next))
-
-    for scaled_current, scaled_next in scaled_surfaces:
-        current_rect = scaled_current.get_rect(center=(center_x, center_y))
-        next_rect = scaled_next.get_rect(center=(center_x, center_y))
+        scales = [1 - progress for progress in TRANSITION_PROGRESS]
+
+    # Integer pixel sizes for every step, computed once up front
+    sizes = [((max(1, int(width * scale)), max(1, int(height * scale))),
+              (max(1, int(width * (1 - scale))), max(1, int(height * (1 - scale)))))
+             for scale in scales if scale > 0]
+
+    for current_size, next_size in sizes:
+        scaled_current = zoom_scaled(current_surf, current_size)
+        scaled_next = zoom_scaled(next_surf, next_size)
 
         screen.fill((0, 0, 0))
-        screen.blit(scaled_current, current_rect)
-        screen.blit(scaled_next, next_rect)
+        screen.blit(scaled_current, scaled_current.get_rect(center=center))
+        screen.blit(scaled_next, scaled_next.get_rect(center=center))
         render_overlays()
         pygame.display.flip()
         clock.tick(TRANSITION_FPS)
@@ -437,17 +681,43 @@ TRANSITION_MAP = {
 FAST_TRANSITIONS = ['slide', 'fade'] if USE_FAST_TRANSITIONS else AVAILABLE_TRANSITIONS
 
 class ReloadHandler(FileSystemEventHandler):
+    def __init__(self):
+        super().__init__()
+        self.dirty = False
+        self.last_event = 0.0
+
     def on_modified(self, event):
-        load_content()  # Reload everything on change
+        # Only flag the change; the main loop reloads once the events settle
+        self.last_event = time.monotonic()
+        self.dirty = True
+
+    # Added, removed and renamed slides need a reload too
+    on_created = on_deleted = on_moved = on_modified
+
+def reload_if_pending():
+    """Reload content once filesystem events have been quiet for RELOAD_DEBOUNCE seconds."""
+    global current_slide
+    if reload_handler.dirty and time.monotonic() - reload_handler.last_event > RELOAD_DEBOUNCE:
+        reload_handler.dirty = False
+        load_content()
+        gc.collect()  # Free the replaced slides right away
+        if slides:
+            current_slide %= len(slides)  # The deck may have shrunk
 
 # Start filesystem watcher
+reload_handler = ReloadHandler()
 observer = Observer()
-observer.schedule(ReloadHandler(), SLIDE_DIR, recursive=False)
+observer.schedule(reload_handler, SLIDE_DIR, recursive=False)
 observer.start()
 
 slides = []
 footer_lines = []
 qr_surface = None
+overlay_blits = []
+footer_cache = None  # (footer_lines, footer blit entries)
+slide_cache = {}  # Slide path -> ((mtime, size), slide), reused across reloads
+dissolve_rects = {}  # Block size -> screen block Rects for the blit dissolve
+zoom_cache = OrderedDict()  # (surface, size) -> scaled surface, least recently used first
 load_content()
 current_slide = 0
 
@@ -460,6 +730,8 @@ if not running:
     exit()
 while running:
     try:
+        # Apply pending slide directory changes between slides, never mid-transition
+        reload_if_pending()
         if slides:
             slide = slides[current_slide]
 
@@ -469,18 +741,15 @@ while running:
                 render_overlays()
                 pygame.display.flip()
 
-                # Non-blocking hold for duration
-                start_time = time.time()
-                while time.time() - start_time < SLIDE_DURATION and running:
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            running = False
-                        elif event.type == pygame.KEYDOWN:
-                            if event.key == pygame.K_ESCAPE:
-                                running = False
-                            elif event.key == pygame.K_q and pygame.key.get_mods() & pygame.KMOD_GUI:
-                                running = False
-                    clock.tick(FPS)
+                # Hold for duration, sleeping in the event queue until the advance timer fires
+                pygame.time.set_timer(SLIDE_ADVANCE_EVENT, max(1, int(SLIDE_DURATION * 1000)), loops=1)
+                while running:
+                    event = pygame.event.wait()
+                    if event.type == SLIDE_ADVANCE_EVENT:
+                        break
+                    if is_quit_event(event):
+                        running = False
+                pygame.time.set_timer(SLIDE_ADVANCE_EVENT, 0)  # Cancel the timer if we quit early
 
                 if not running:
                     break
@@ -495,36 +764,38 @@ while running:
                     # Check events during transition (added to each func, but for brevity omitted here; add if needed)
 
             elif slide['type'] == 'video':
-                # Play video
-                reader = imageio.get_reader(slide['path'])
-                for frame in reader:
-                    if not running:
-                        break
-
-                    # Frame is numpy array (h, w, c) RGB
-                    frame_surf = pygame.surfarray.make_surface(np.swapaxes(frame, 0, 1))  # Swap to (w, h, c) for surfarray
-                    frame_surf = pygame.transform.scale(frame_surf, screen.get_size())
-                    frame_surf = frame_surf.convert()  # Convert for faster blitting
-
-                    screen.blit(frame_surf, (0, 0))
-                    render_overlays()
-                    pygame.display.flip()
-
-                    # Check events
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            running = False
-                        elif event.type == pygame.KEYDOWN:
-                            if event.key == pygame.K_ESCAPE:
-                                running = False
-                            elif event.key == pygame.K_q and pygame.key.get_mods() & pygame.KMOD_GUI:
+                # Open a reader for this playback only, so no ffmpeg process sits idle between plays,
+                # and let ffmpeg scale to the screen so frames need no rescale in Python
+                reader = imageio.get_reader(slide['path'], input_params=list(slide['input_params']),
+                                            output_params=['-vf', f'scale={SCREEN_W}:{SCREEN_H}'])
+                try:
+                    video_fps = slide['fps'] or FPS  # Pace to the video's own frame rate
+                    frame_ms = 1000.0 / video_fps
+                    start_ticks = pygame.time.get_ticks()
+                    for index, frame in enumerate(reader):
+                        if not running:
+                            break
+
+                        # Frame is a row-major (h, w, c) RGB array, wrap it without copying or swapping axes
+                        screen.blit(pygame.image.frombuffer(frame, SCREEN_SIZE, 'RGB'), (0, 0))
+                        render_overlays()
+                        pygame.display.flip()
+
+                        # Check events
+                        for event in pygame.event.get():
+                            if is_quit_event(event):
                                 running = False
 
-                    clock.tick(FPS)  # Cap to FPS (adjust if video FPS differs)
-
-                reader.close()
+                        # Sleep until this frame's deadline from the start of playback, so ms rounding never accumulates
+                        delay = int(start_ticks + (index + 1) * frame_ms) - pygame.time.get_ticks()
+                        if delay > 0:
+                            pygame.time.wait(delay)
+                finally:
+                    reader.close()  # Stop ffmpeg even if playback failed
 
             current_slide = (current_slide + 1) % len(slides)
+            # Drop this iteration's references so the next reload can free replaced slides
+            slide = next_slide = reader = frame = None
         else:
             display_error("No valid slides found. Retrying...")
             load_content()